@@ -0,0 +1,231 @@
+"""Audio conversion between Discord (48kHz stereo) and PersonaPlex (24kHz mono)."""
+
+import logging
+
+import numpy as np
+import sphn
+from scipy import signal
+
+log = logging.getLogger(__name__)
+
+DISCORD_SAMPLE_RATE = 48000
+PERSONAPLEX_SAMPLE_RATE = 24000
+DISCORD_CHANNELS = 2
+
+FRAME_SIZE = 3840  # 20ms at 48kHz stereo int16
+FRAME_SAMPLES = FRAME_SIZE // 2  # 1920 interleaved int16 samples per frame
+
+# One 20ms frame after stereo fold and 2:1 downsampling. sphn's append_pcm
+# only accepts exact opus frame sizes (120/240/480/960/1920/2880 at 24kHz),
+# so batched input must be fed to the writer in chunks of this size.
+_OPUS_FRAME_SAMPLES = FRAME_SAMPLES // DISCORD_CHANNELS // 2  # 480
+
+# Playback ring capacity in int16 samples. Power of two so read/write indices
+# wrap with a mask instead of a modulo.
+_RING_SAMPLES = 65536
+
+# Polyphase anti-aliasing filter for the fixed 2:1 / 1:2 resampling. An even
+# tap count keeps the decimation phase aligned across streamed blocks.
+_FIR_TAPS = 64
+
+_SILENCE_PCM = bytes(FRAME_SIZE)
+
+
+class AudioConverter:
+    """Converts between Discord PCM frames and PersonaPlex OggOpus streams.
+
+    Playback PCM waiting to be cut into 3840-byte Discord frames is held in a
+    fixed-size int16 ring buffer, so the hot path never reallocates a residual
+    buffer per call.
+    """
+
+    def __init__(self) -> None:
+        self.opus_writer = sphn.OpusStreamWriter(PERSONAPLEX_SAMPLE_RATE)
+        self.opus_reader = sphn.OpusStreamReader(PERSONAPLEX_SAMPLE_RATE)
+
+        # Fixed-ratio resampling filter, designed once instead of per frame
+        # (resample_poly rebuilds its Kaiser FIR on every call and works in
+        # float64). The 2x gain on the upsampling taps compensates for the
+        # energy lost to zero-stuffing.
+        h = signal.firwin(_FIR_TAPS, 0.5, window=("kaiser", 5.0)).astype(np.float32)
+        self._h_down = h
+        self._h_up = h * np.float32(2.0)
+
+        # One filter-length of input history per direction carries the FIR
+        # state across calls, so streamed blocks are continuous. The capture
+        # direction keeps its history in-place at the head of a persistent
+        # input buffer so the hot path never concatenates.
+        mono_samples = FRAME_SAMPLES // DISCORD_CHANNELS
+        self._down_x = np.zeros(_FIR_TAPS + mono_samples, dtype=np.float32)
+        self._up_hist = np.zeros(_FIR_TAPS, dtype=np.float32)
+
+        # Reusable capture scratch: int32 channel sum and its float32 rescale.
+        self._mono_i32 = np.empty(mono_samples, dtype=np.int32)
+        self._mono_f32 = np.empty(mono_samples, dtype=np.float32)
+
+        # Silence fast path: a cached zero block at 24kHz and a counter of
+        # consecutive silence frames (the first couple still run the full
+        # DSP path so the resampler history flushes cleanly).
+        self._silence_f32 = np.zeros(mono_samples // 2, dtype=np.float32)
+        self._silence_run = 0
+
+        # Ring buffer for decoded playback PCM. Indices grow monotonically and
+        # are masked on access; (self._w - self._r) is the fill level.
+        self._ring = np.zeros(_RING_SAMPLES, dtype=np.int16)
+        self._mask = _RING_SAMPLES - 1
+        self._w = 0
+        self._r = 0
+
+        # Scratch frame used when a read window wraps around the ring end.
+        self._scratch = bytearray(FRAME_SIZE)
+        self._scratch_i16 = np.frombuffer(self._scratch, dtype=np.int16)
+
+        # Reusable decode scratch: one float32 quantization buffer and one
+        # interleaved int16 stereo buffer, grown on demand if the decoder ever
+        # hands back a larger chunk.
+        self._quant = np.empty(16384, dtype=np.float32)
+        self._stereo = np.empty((16384, 2), dtype=np.int16)
+
+    def discord_to_personaplex(self, pcm_bytes: bytes) -> bytes | None:
+        """Convert Discord PCM to OggOpus bytes, or None while buffering.
+
+        Accepts one 20ms frame or a batched multiple of frames (e.g. when
+        draining a backlog). The stereo fold and resampling run once over the
+        whole block; only the opus writer hand-off is chunked, because sphn's
+        append_pcm rejects anything but exact opus frame sizes — one call in
+        the steady state, one per frame when batched.
+        """
+        self._silence_run = 0
+        pcm = np.frombuffer(pcm_bytes, dtype=np.int16).reshape(-1, DISCORD_CHANNELS)
+        n = pcm.shape[0]
+        if n > self._mono_i32.size:
+            self._mono_i32 = np.empty(n, dtype=np.int32)
+            self._mono_f32 = np.empty(n, dtype=np.float32)
+        mono_i32 = self._mono_i32[:n]
+        mono_f32 = self._mono_f32[:n]
+
+        # Channel average, int16->float32 and the /32768 scale fused into one
+        # pass: (l + r) / 2 / 32768 == (l + r) / 65536. Stays in int32 instead
+        # of the float64 round-trip .mean() would take, and both results land
+        # in persistent scratch — no per-frame allocations.
+        np.add(pcm[:, 0], pcm[:, 1], out=mono_i32)
+        np.multiply(mono_i32, 1.0 / 65536.0, out=mono_f32)
+        float_pcm = self._downsample(mono_f32)
+
+        append_pcm = self.opus_writer.append_pcm
+        for i in range(0, float_pcm.size, _OPUS_FRAME_SAMPLES):
+            append_pcm(float_pcm[i:i + _OPUS_FRAME_SAMPLES])
+        opus_bytes = self.opus_writer.read_bytes()
+        return opus_bytes if opus_bytes else None
+
+    def encode_silence(self) -> bytes | None:
+        """Encode one 20ms silence frame for the continuous upstream feed.
+
+        The OggOpus stream must stay continuous (page sequence numbers and
+        granule positions advance per page), so silence cannot be pre-encoded
+        and replayed. Instead, once the resampler history has flushed to zero
+        — two full frames through the normal path — the stereo-fold/resample
+        front-end is skipped and a cached zero block goes straight to the
+        encoder.
+        """
+        run = self._silence_run
+        if run < 2:
+            opus_bytes = self.discord_to_personaplex(_SILENCE_PCM)
+            self._silence_run = run + 1  # discord_to_personaplex reset it
+            return opus_bytes
+        self.opus_writer.append_pcm(self._silence_f32)
+        opus_bytes = self.opus_writer.read_bytes()
+        return opus_bytes if opus_bytes else None
+
+    def personaplex_to_discord(self, opus_bytes: bytes) -> list[bytes]:
+        """Convert OggOpus bytes to complete 3840-byte Discord playback frames."""
+        self.opus_reader.append_bytes(opus_bytes)
+        float_pcm = self.opus_reader.read_pcm()
+        if float_pcm is None or len(float_pcm) == 0:
+            return []
+
+        upsampled = self._upsample(np.asarray(float_pcm, dtype=np.float32))
+        n = upsampled.size
+        if n > self._quant.size:
+            self._quant = np.empty(n, dtype=np.float32)
+            self._stereo = np.empty((n, 2), dtype=np.int16)
+
+        # Scale/round/clip in place, then duplicate into both channels of the
+        # interleaved stereo scratch — no column_stack/ravel temporaries.
+        quant = self._quant[:n]
+        np.multiply(upsampled, 32767.0, out=quant)
+        np.rint(quant, out=quant)
+        np.clip(quant, -32768, 32767, out=quant)
+        stereo = self._stereo[:n]
+        stereo[:, 0] = quant
+        stereo[:, 1] = stereo[:, 0]
+
+        self._ring_write(stereo.reshape(-1))
+        return self._ring_read_frames()
+
+    def _downsample(self, mono_f32: np.ndarray) -> np.ndarray:
+        """48kHz -> 24kHz with the precomputed FIR, continuous across calls."""
+        n = mono_f32.size
+        if _FIR_TAPS + n > self._down_x.size:
+            grown = np.empty(_FIR_TAPS + n, dtype=np.float32)
+            grown[:_FIR_TAPS] = self._down_x[:_FIR_TAPS]
+            self._down_x = grown
+        x = self._down_x[:_FIR_TAPS + n]
+        x[_FIR_TAPS:] = mono_f32
+        y = signal.upfirdn(self._h_down, x, up=1, down=2)
+        # Slide the last filter-length of input back to the head as history.
+        tail = x[n:]
+        if n < _FIR_TAPS:  # overlapping slices need a copy
+            tail = tail.copy()
+        x[:_FIR_TAPS] = tail
+        # The first TAPS//2 decimated outputs replay the history block.
+        return y[_FIR_TAPS // 2:_FIR_TAPS // 2 + n // 2]
+
+    def _upsample(self, pcm_f32: np.ndarray) -> np.ndarray:
+        """24kHz -> 48kHz with the precomputed FIR, continuous across calls."""
+        xcat = np.concatenate([self._up_hist, pcm_f32])
+        y = signal.upfirdn(self._h_up, xcat, up=2, down=1)
+        self._up_hist = xcat[-_FIR_TAPS:]
+        # The first 2*TAPS interpolated outputs replay the history block.
+        return y[2 * _FIR_TAPS:2 * _FIR_TAPS + 2 * pcm_f32.size]
+
+    def _ring_write(self, samples: np.ndarray) -> None:
+        n = samples.size
+        dropped = 0
+        if n > _RING_SAMPLES:
+            # A block larger than the whole ring (the decoder can hand back a
+            # long accumulated stretch after an event-loop stall) would break
+            # the wrap-split below; keep only the newest ring-full of samples.
+            dropped = n - _RING_SAMPLES
+            samples = samples[dropped:]
+            n = _RING_SAMPLES
+        free = _RING_SAMPLES - (self._w - self._r)
+        if n > free:
+            # Overrun: drop the oldest buffered samples to make room.
+            self._r += n - free
+            dropped += n - free
+        if dropped:
+            log.warning("Playback ring overrun, dropped %d samples", dropped)
+
+        idx = self._w & self._mask
+        if idx + n <= _RING_SAMPLES:
+            self._ring[idx:idx + n] = samples
+        else:
+            first = _RING_SAMPLES - idx
+            self._ring[idx:] = samples[:first]
+            self._ring[:n - first] = samples[first:]
+        self._w += n
+
+    def _ring_read_frames(self) -> list[bytes]:
+        frames = []
+        while self._w - self._r >= FRAME_SAMPLES:
+            idx = self._r & self._mask
+            if idx + FRAME_SAMPLES <= _RING_SAMPLES:
+                frames.append(self._ring[idx:idx + FRAME_SAMPLES].tobytes())
+            else:
+                first = _RING_SAMPLES - idx
+                self._scratch_i16[:first] = self._ring[idx:]
+                self._scratch_i16[first:] = self._ring[:FRAME_SAMPLES - first]
+                frames.append(bytes(self._scratch))
+            self._r += FRAME_SAMPLES
+        return frames
@@ -28,24 +28,28 @@ BEAT_DURATION = 60.0 / BPM
 
 
 def _make_note(freq: float, duration: float) -> np.ndarray:
-    """Generate a sine wave with attack/release envelope."""
+    """Generate a sine wave with attack/release envelope.
+
+    Computed in place in a single float32 buffer; the envelope only touches
+    the attack/release edges instead of materializing a full-length ramp.
+    """
     n_samples = int(SAMPLE_RATE * duration)
-    t = np.arange(n_samples, dtype=np.float64) / SAMPLE_RATE
 
-    # Sine wave
-    wave = np.sin(2 * np.pi * freq * t)
+    out = np.arange(n_samples, dtype=np.float32)
+    out *= np.float32(2.0 * np.pi * freq / SAMPLE_RATE)
+    np.sin(out, out=out)
+    out *= np.float32(0.9)
 
     # Attack/release envelope (10ms attack, 30ms release)
     attack_samples = int(SAMPLE_RATE * 0.01)
     release_samples = int(SAMPLE_RATE * 0.03)
 
-    envelope = np.ones(n_samples, dtype=np.float64)
-    if attack_samples > 0 and attack_samples < n_samples:
-        envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
-    if release_samples > 0 and release_samples < n_samples:
-        envelope[-release_samples:] = np.linspace(1, 0, release_samples)
+    if 0 < attack_samples < n_samples:
+        out[:attack_samples] *= np.linspace(0, 1, attack_samples, dtype=np.float32)
+    if 0 < release_samples < n_samples:
+        out[-release_samples:] *= np.linspace(1, 0, release_samples, dtype=np.float32)
 
-    return (wave * envelope * 0.9).astype(np.float32)
+    return out
 
 
 def generate_ode_to_joy() -> bytes:
@@ -61,7 +65,15 @@ def generate_ode_to_joy() -> bytes:
     # Convert to int16
     int16_mono = (mono * 32767).clip(-32768, 32767).astype(np.int16)
 
-    # Stereo: duplicate channel
-    stereo = np.column_stack([int16_mono, int16_mono]).flatten()
+    # Stereo: duplicate the channel with two strided stores instead of a
+    # column_stack + flatten pair of temporaries.
+    stereo = np.empty(int16_mono.size * 2, dtype=np.int16)
+    stereo[0::2] = int16_mono
+    stereo[1::2] = int16_mono
 
     return stereo.tobytes()
+
+
+# Precomputed once at import: the melody is deterministic, so every join
+# shares the same immutable bytes object instead of regenerating it.
+ODE_TO_JOY_PCM: bytes = generate_ode_to_joy()
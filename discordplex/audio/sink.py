@@ -0,0 +1,94 @@
+"""Streaming sink that captures Discord voice PCM into a lock-free frame ring."""
+
+import logging
+
+from discord.sinks import Sink
+
+log = logging.getLogger(__name__)
+
+FRAME_SIZE = 3840  # 20ms at 48kHz stereo int16
+
+
+class SPSCFrameRing:
+    """Single-producer/single-consumer ring of fixed-size audio frames.
+
+    Backed by one preallocated bytearray; the producer (py-cord's decoder
+    thread) only advances ``_head`` and the consumer (the playback/send side)
+    only advances ``_tail``, so under the GIL no lock is needed and neither
+    side ever blocks. Frame copies are single C-level memcpys, which the GIL
+    serializes, so frames are never torn. When the producer laps the
+    consumer, the consumer skips forward to the oldest frame still valid —
+    drop-oldest semantics with no exception flow.
+    """
+
+    def __init__(self, capacity_frames: int = 64, frame_size: int = FRAME_SIZE) -> None:
+        if capacity_frames & (capacity_frames - 1):
+            raise ValueError("capacity_frames must be a power of two")
+        self._frame_size = frame_size
+        self._capacity = capacity_frames
+        self._mask = capacity_frames - 1
+        self._buf = bytearray(capacity_frames * frame_size)
+        self._mv = memoryview(self._buf)
+        self._head = 0  # next slot to write; written only by the producer
+        self._tail = 0  # next slot to read; written only by the consumer
+        self.dropped = 0  # total frames lost to producer overruns
+
+    def __len__(self) -> int:
+        return min(self._head - self._tail, self._capacity)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def push(self, data: bytes) -> None:
+        """Producer side: copy one frame into the next slot."""
+        head = self._head
+        idx = (head & self._mask) * self._frame_size
+        self._mv[idx:idx + self._frame_size] = data
+        self._head = head + 1
+
+    def pop(self) -> bytes | None:
+        """Consumer side: copy out the oldest frame, or None when empty."""
+        tail = self._tail
+        head = self._head
+        if head == tail:
+            return None
+        if head - tail > self._capacity:
+            # Producer lapped us while we were away; resume at the oldest
+            # slot that has not been overwritten.
+            skipped = head - self._capacity - tail
+            self.dropped += skipped
+            tail = head - self._capacity
+            if self.dropped % 64 < skipped:  # throttle to roughly once per 64
+                log.debug("Frame ring overrun: %d frames dropped total", self.dropped)
+        idx = (tail & self._mask) * self._frame_size
+        frame = bytes(self._mv[idx:idx + self._frame_size])
+        self._tail = tail + 1
+        return frame
+
+
+class StreamingSink(Sink):
+    """Sink that feeds incoming voice PCM into an :class:`SPSCFrameRing`.
+
+    ``write`` runs on py-cord's decoder thread and must never block; the only
+    work per call is one frame copy into the ring.
+    """
+
+    def __init__(self, ring: SPSCFrameRing) -> None:
+        super().__init__()
+        self.ring = ring
+        self._pending = bytearray()
+
+    def write(self, data: bytes, user: int) -> None:
+        # Fast path: py-cord hands us exactly one 20ms frame.
+        if not self._pending and len(data) == FRAME_SIZE:
+            self.ring.push(data)
+            return
+        # Odd-sized packet: accumulate and emit whole frames.
+        self._pending += data
+        while len(self._pending) >= FRAME_SIZE:
+            self.ring.push(self._pending[:FRAME_SIZE])
+            del self._pending[:FRAME_SIZE]
+
+    def cleanup(self) -> None:
+        self._pending.clear()
@@ -2,6 +2,8 @@
 
 import discord
 
+from discordplex.audio.sink import SPSCFrameRing
+
 
 class PCMArraySource(discord.AudioSource):
     """Wraps a pre-generated PCM bytes buffer for Discord playback.
@@ -13,18 +15,20 @@ class PCMArraySource(discord.AudioSource):
     FRAME_SIZE = 3840  # 20ms * 48000Hz * 2ch * 2bytes
 
     def __init__(self, pcm_data: bytes) -> None:
-        self._data = pcm_data
+        # Pad to a whole number of frames up front so every read() is an
+        # unconditional fixed-size copy out of a memoryview.
+        remainder = len(pcm_data) % self.FRAME_SIZE
+        if remainder:
+            pcm_data += bytes(self.FRAME_SIZE - remainder)
+        self._view = memoryview(pcm_data)
         self._offset = 0
 
     def read(self) -> bytes:
-        end = self._offset + self.FRAME_SIZE
-        if self._offset >= len(self._data):
+        if self._offset >= len(self._view):
             return b""
-        chunk = self._data[self._offset:end]
+        end = self._offset + self.FRAME_SIZE
+        chunk = bytes(self._view[self._offset:end])
         self._offset = end
-        # Pad last chunk with silence if needed
-        if len(chunk) < self.FRAME_SIZE:
-            chunk += b"\x00" * (self.FRAME_SIZE - len(chunk))
         return chunk
 
     def is_opus(self) -> bool:
@@ -32,3 +36,27 @@ class PCMArraySource(discord.AudioSource):
 
     def cleanup(self) -> None:
         pass
+
+
+class StreamingPlaybackSource(discord.AudioSource):
+    """Plays frames popped from an :class:`SPSCFrameRing`.
+
+    read() runs on py-cord's playback thread; when no frame is ready it
+    returns a shared silence frame so playback never stalls.
+    """
+
+    FRAME_SIZE = 3840
+    _SILENCE = bytes(FRAME_SIZE)
+
+    def __init__(self, ring: SPSCFrameRing) -> None:
+        self._ring = ring
+
+    def read(self) -> bytes:
+        frame = self._ring.pop()
+        return frame if frame is not None else self._SILENCE
+
+    def is_opus(self) -> bool:
+        return False
+
+    def cleanup(self) -> None:
+        pass
@@ -2,26 +2,41 @@
 
 import asyncio
 import logging
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 
+import aiohttp
 import discord
 from discord.ext import commands
 from discord.sinks import MP3Sink
 
-from discordplex.audio.ode_to_joy import generate_ode_to_joy
+from discordplex.audio.ode_to_joy import ODE_TO_JOY_PCM
 from discordplex.audio.source import PCMArraySource
+from discordplex.bridge.session import VoiceSession
+from discordplex.config import DEFAULT_PROMPT, DEFAULT_VOICE
 
 log = logging.getLogger(__name__)
 
 RECORDINGS_DIR = Path("./recordings")
 
 
+def _save_recording(filename: Path, file) -> None:
+    """Stream one recording to disk; runs in a worker thread."""
+    # Stream in 64KB chunks instead of materializing the whole MP3 with
+    # getvalue(), which doubles peak memory for long recordings.
+    file.seek(0)
+    with open(filename, "wb") as f:
+        shutil.copyfileobj(file, f, length=64 * 1024)
+    log.info("Saved recording: %s (%d bytes)", filename, filename.stat().st_size)
+
+
 async def _recording_finished(sink: MP3Sink, *args) -> None:
     """Save per-user MP3 files when recording stops."""
     RECORDINGS_DIR.mkdir(exist_ok=True)
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
 
+    saves = []
     for user_id, audio_data in sink.audio_data.items():
         # Try to resolve the username from the channel members
         username = str(user_id)
@@ -31,9 +46,61 @@ async def _recording_finished(sink: MP3Sink, *args) -> None:
                 username = member.name
 
         filename = RECORDINGS_DIR / f"{timestamp}_{username}.mp3"
-        with open(filename, "wb") as f:
-            f.write(audio_data.file.getvalue())
-        log.info("Saved recording: %s (%d bytes)", filename, audio_data.file.tell())
+        saves.append(asyncio.to_thread(_save_recording, filename, audio_data.file))
+
+    # Write off the event loop (and concurrently) so a long recording flush
+    # doesn't stall the voice send path.
+    if saves:
+        await asyncio.gather(*saves)
+
+
+def _find_text_channel(
+    bot: commands.Bot, guild: discord.Guild
+) -> discord.TextChannel | None:
+    """Pick the text channel for session output: #general, else the first one.
+
+    Backed by a per-guild dict keyed by lowercase channel name so the lookup
+    on the voice-join path is O(1); the cache is invalidated by the guild
+    channel events registered in create_bot.
+    """
+    index = bot._text_channel_index.get(guild.id)
+    if index is None:
+        index = {c.name.lower(): c for c in guild.text_channels}
+        bot._text_channel_index[guild.id] = index
+    channel = index.get("general")
+    if channel is None and index:
+        channel = next(iter(index.values()))
+    return channel
+
+
+class DiscordPlexBot(commands.Bot):
+    """commands.Bot plus DiscordPlex session state and a shared HTTP session."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Per-user settings: {user_id: {"text_prompt": str, "voice_prompt": str}}
+        self.user_settings: dict[int, dict] = {}
+        # Current active voice session (None = free)
+        self.active_session = None
+        # Lazy per-guild text-channel index for _find_text_channel:
+        # {guild_id: {lowercase_name: channel}}
+        self._text_channel_index: dict[int, dict[str, discord.TextChannel]] = {}
+        # One aiohttp session per process; every PersonaPlexClient reuses its
+        # connector pool instead of paying session setup per voice session.
+        self.http_session: aiohttp.ClientSession | None = None
+
+    def get_http_session(self) -> aiohttp.ClientSession:
+        if self.http_session is None or self.http_session.closed:
+            self.http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=False, limit=0)
+            )
+        return self.http_session
+
+    async def close(self) -> None:
+        if self.http_session is not None:
+            await self.http_session.close()
+            self.http_session = None
+        await super().close()
 
 
 def create_bot() -> commands.Bot:
@@ -41,17 +108,28 @@ def create_bot() -> commands.Bot:
     intents.message_content = True
     intents.voice_states = True
 
-    bot = commands.Bot(command_prefix="!", intents=intents)
-
-    # Per-user settings: {user_id: {"text_prompt": str, "voice_prompt": str}}
-    bot.user_settings: dict[int, dict] = {}
-
-    # Current active voice session (None = free) — used in Phase 2
-    bot.active_session = None
+    bot = DiscordPlexBot(command_prefix="!", intents=intents)
 
     @bot.event
     async def on_ready() -> None:
         log.info("DiscordPlex bot ready as %s", bot.user)
+        # Python 3.12+: run new tasks eagerly. Session-loop awaits like
+        # Queue.put with room or a writable ws.send_bytes then complete
+        # without a scheduler round-trip. Idempotent across reconnects.
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    @bot.event
+    async def on_guild_channel_create(channel) -> None:
+        bot._text_channel_index.pop(channel.guild.id, None)
+
+    @bot.event
+    async def on_guild_channel_delete(channel) -> None:
+        bot._text_channel_index.pop(channel.guild.id, None)
+
+    @bot.event
+    async def on_guild_channel_update(before, after) -> None:
+        bot._text_channel_index.pop(after.guild.id, None)
 
     @bot.event
     async def on_voice_state_update(
@@ -69,13 +147,49 @@ def create_bot() -> commands.Bot:
         if after.channel and (not before.channel or before.channel != after.channel):
             # Only join if bot isn't already in a voice channel in this guild
             if guild.voice_client is None:
+                # First-come-first-served: PersonaPlex has a single session
+                if bot.active_session is not None:
+                    channel = _find_text_channel(bot, guild)
+                    if channel:
+                        await channel.send(
+                            f"{member.mention} the bot is currently in a "
+                            "session with another user."
+                        )
+                    return
                 try:
                     vc = await after.channel.connect()
                     log.info("Joined voice channel: %s", after.channel.name)
                     await asyncio.sleep(0.5)
+                    # Greeting doubles as feedback while PersonaPlex spends
+                    # seconds processing the prompts
                     _play_greeting(vc)
                 except Exception:
                     log.exception("Failed to join voice channel")
+                    return
+
+                settings = bot.user_settings.get(member.id, {})
+                session = VoiceSession(
+                    vc,
+                    _find_text_channel(bot, guild),
+                    settings.get("text_prompt", DEFAULT_PROMPT),
+                    settings.get("voice_prompt", DEFAULT_VOICE),
+                    bot.get_http_session(),
+                )
+                # Reserve the slot before awaiting start(): the handshake can
+                # take up to a minute, and a join in another guild during that
+                # window must not start a second session against the
+                # single-session PersonaPlex server.
+                bot.active_session = session
+                try:
+                    await session.start()
+                except Exception:
+                    # Fall back to Phase 1 behavior: record the channel
+                    log.exception(
+                        "PersonaPlex session failed, falling back to recording"
+                    )
+                    bot.active_session = None
+                    await session.stop()
+                    _start_recording(vc)
 
         # User left or moved away from a voice channel
         if before.channel and (not after.channel or before.channel != after.channel):
@@ -85,6 +199,10 @@ def create_bot() -> commands.Bot:
                 non_bot_members = [m for m in before.channel.members if not m.bot]
                 if not non_bot_members:
                     log.info("All users left %s, disconnecting", before.channel.name)
+                    session = bot.active_session
+                    if session is not None and session.voice_client is vc:
+                        await session.stop()
+                        bot.active_session = None
                     if vc.recording:
                         vc.stop_recording()
                         # Give recv_audio thread time to run the callback
@@ -95,19 +213,20 @@ def create_bot() -> commands.Bot:
 
 
 def _play_greeting(vc: discord.VoiceClient) -> None:
-    """Play Ode to Joy as a greeting, then start recording."""
-    pcm_data = generate_ode_to_joy()
-    source = PCMArraySource(pcm_data)
+    """Play Ode to Joy as a greeting."""
+    source = PCMArraySource(ODE_TO_JOY_PCM)
 
     def _after_playback(error: Exception | None) -> None:
         if error:
             log.error("Playback error: %s", error)
-            return
-        # after callback runs in a thread — schedule recording on the event loop
-        try:
-            vc.start_recording(MP3Sink(), _recording_finished)
-            log.info("Recording started")
-        except Exception:
-            log.exception("Failed to start recording")
 
     vc.play(source, after=_after_playback)
+
+
+def _start_recording(vc: discord.VoiceClient) -> None:
+    """Phase 1 fallback: record the channel to per-user MP3 files."""
+    try:
+        vc.start_recording(MP3Sink(), _recording_finished)
+        log.info("Recording started")
+    except Exception:
+        log.exception("Failed to start recording")
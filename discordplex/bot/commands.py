@@ -1,7 +1,7 @@
 """Prefix commands for DiscordPlex bot."""
 
 import logging
-from pathlib import Path
+import os
 
 import discord
 from discord.ext import commands
@@ -10,10 +10,45 @@ log = logging.getLogger(__name__)
 
 from discordplex.config import DEFAULT_PROMPT, DEFAULT_VOICE, VOICE_PROMPT_DIR
 
+# Display order and labels for the voice categories; anything else falls
+# into an "other" bucket keyed by its prefix.
+_VOICE_LABELS: tuple[tuple[str, str], ...] = (
+    ("NATF", "Natural Female"),
+    ("NATM", "Natural Male"),
+    ("VARF", "Varied Female"),
+    ("VARM", "Varied Male"),
+)
+_KNOWN_PREFIXES = frozenset(prefix for prefix, _ in _VOICE_LABELS)
+
 
 class VoiceCommands(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
+        # Directory listing cache keyed by mtime:
+        # (st_mtime_ns, sorted names, name set). The voice dir lives in a
+        # HuggingFace snapshot that rarely changes, so each command pays one
+        # stat instead of a readdir + fnmatch walk; membership checks are
+        # O(1) against the set.
+        self._voice_cache: tuple[int, list[str], frozenset[str]] | None = None
+
+    def _get_voices(self) -> list[str] | None:
+        """Sorted *.pt names in VOICE_PROMPT_DIR, or None if the dir is missing.
+
+        Rescans only when the directory mtime changes.
+        """
+        try:
+            st = os.stat(VOICE_PROMPT_DIR)
+        except OSError:
+            self._voice_cache = None
+            return None
+        if self._voice_cache is None or self._voice_cache[0] != st.st_mtime_ns:
+            voices = sorted(
+                e.name
+                for e in os.scandir(VOICE_PROMPT_DIR)
+                if e.name.endswith(".pt")
+            )
+            self._voice_cache = (st.st_mtime_ns, voices, frozenset(voices))
+        return self._voice_cache[1]
 
     @commands.command(name="prompt")
     async def set_prompt(self, ctx: commands.Context, *, text: str) -> None:
@@ -32,8 +67,9 @@ class VoiceCommands(commands.Cog):
         if not name.endswith(".pt"):
             name += ".pt"
 
-        voice_path = Path(VOICE_PROMPT_DIR) / name
-        if not voice_path.exists():
+        # _get_voices re-stats the dir, so a newly added file (which bumps
+        # the dir mtime) is picked up before we reject.
+        if self._get_voices() is None or name not in self._voice_cache[2]:
             await ctx.reply(f"Voice `{name}` not found. Use `!voice-list` to see available voices.")
             return
 
@@ -46,41 +82,34 @@ class VoiceCommands(commands.Cog):
     async def voice_list(self, ctx: commands.Context) -> None:
         """List available voices grouped by category."""
         log.info("!voice-list from %s", ctx.author)
-        voice_dir = Path(VOICE_PROMPT_DIR)
-        if not voice_dir.is_dir():
+        voices = self._get_voices()
+        if voices is None:
             await ctx.reply("Voice directory not found.")
             return
-
-        voices = sorted(f.name for f in voice_dir.glob("*.pt"))
         if not voices:
             await ctx.reply("No voice files found.")
             return
 
-        # Group by prefix
-        categories: dict[str, list[str]] = {}
-        labels = {
-            "NATF": "Natural Female",
-            "NATM": "Natural Male",
-            "VARF": "Varied Female",
-            "VARM": "Varied Male",
-        }
+        # Single pass into preinitialized buckets; unknown prefixes go to
+        # a separate dict so no second filtering pass is needed.
+        buckets: dict[str, list[str]] = {prefix: [] for prefix, _ in _VOICE_LABELS}
+        other: dict[str, list[str]] = {}
         for v in voices:
             prefix = v[:4]
-            categories.setdefault(prefix, []).append(v)
+            if prefix in _KNOWN_PREFIXES:
+                buckets[prefix].append(v)
+            else:
+                other.setdefault(prefix, []).append(v)
 
         lines = [f"**Available Voices ({len(voices)} total)**\n"]
-        for prefix, label in labels.items():
-            group = categories.get(prefix, [])
+        for prefix, label in _VOICE_LABELS:
+            group = buckets[prefix]
             if group:
                 names = ", ".join(f"`{n}`" for n in group)
                 lines.append(f"**{label}**: {names}")
-
-        # Any uncategorized
-        known = set(labels.keys())
-        for prefix, group in categories.items():
-            if prefix not in known:
-                names = ", ".join(f"`{n}`" for n in group)
-                lines.append(f"**{prefix}**: {names}")
+        for prefix, group in other.items():
+            names = ", ".join(f"`{n}`" for n in group)
+            lines.append(f"**{prefix}**: {names}")
 
         await ctx.reply("\n".join(lines))
 
@@ -0,0 +1,215 @@
+"""VoiceSession: ties a Discord voice connection to a PersonaPlex session."""
+
+import asyncio
+import logging
+
+import aiohttp
+import discord
+
+from discordplex.audio.converter import FRAME_SIZE, AudioConverter
+from discordplex.audio.sink import SPSCFrameRing, StreamingSink
+from discordplex.audio.source import StreamingPlaybackSource
+from discordplex.personaplex.client import PersonaPlexClient
+
+log = logging.getLogger(__name__)
+
+FRAME_SECONDS = 0.02
+
+# Text batching: coalesce AI tokens until a sentence ends, the buffer grows
+# past the cap, or the debounce window expires — each channel.send is a full
+# HTTPS round-trip, so per-token sends serialize latency and eat rate limit.
+TEXT_DEBOUNCE_SECONDS = 0.4
+TEXT_FLUSH_CHARS = 200
+_SENTENCE_ENDS = (".", "!", "?", "\n")
+
+# One 20ms frame of 48kHz stereo int16 silence, shared and immutable. Idle
+# ticks go through the converter's silence fast path; this constant remains
+# for callers that need a raw silence frame.
+SILENCE_FRAME: bytes = bytes(FRAME_SIZE)
+
+
+async def _discard_recording(sink, *args) -> None:
+    """start_recording callback; the streaming sink has nothing to flush."""
+
+
+class VoiceSession:
+    """One user's live bridge between a Discord voice channel and PersonaPlex.
+
+    Audio flows Discord -> StreamingSink -> input ring -> converter ->
+    PersonaPlex, and back PersonaPlex -> converter -> output ring ->
+    StreamingPlaybackSource -> Discord. AI text tokens are batched into the
+    guild text channel. The converter owns all per-frame scratch buffers, so
+    steady-state relaying does no Python-level allocation beyond the opus
+    payloads themselves.
+    """
+
+    def __init__(
+        self,
+        voice_client: discord.VoiceClient,
+        text_channel: discord.TextChannel | None,
+        text_prompt: str,
+        voice_prompt: str,
+        http_session: aiohttp.ClientSession,
+    ) -> None:
+        self.voice_client = voice_client
+        self.text_channel = text_channel
+        self.text_prompt = text_prompt
+        self.voice_prompt = voice_prompt
+
+        self.converter = AudioConverter()
+        self.personaplex = PersonaPlexClient(http_session)
+        self.input_ring = SPSCFrameRing()
+        self.output_ring = SPSCFrameRing()
+        self.sink = StreamingSink(self.input_ring)
+        self.source = StreamingPlaybackSource(self.output_ring)
+
+        self._tasks: list[asyncio.Task] = []
+        # Token list + running length: appending to an attribute string
+        # re-copies the whole buffer per token (the refcount-1 in-place
+        # optimization doesn't fire on attributes).
+        self._text_buffer: list[str] = []
+        self._text_buffer_len = 0
+
+    async def start(self) -> None:
+        """Connect to PersonaPlex and start relaying audio and text."""
+        await self.personaplex.connect(self.text_prompt, self.voice_prompt)
+
+        if self.voice_client.is_playing():
+            self.voice_client.stop()
+        self.voice_client.start_recording(self.sink, _discard_recording)
+        self.voice_client.play(self.source)
+
+        self._tasks = [
+            asyncio.create_task(self._send_loop(), name="personaplex-send"),
+            asyncio.create_task(self._recv_loop(), name="personaplex-recv"),
+            asyncio.create_task(self._text_loop(), name="personaplex-text"),
+        ]
+        log.info("Voice session started (voice=%s)", self.voice_prompt)
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        vc = self.voice_client
+        try:
+            if vc.recording:
+                vc.stop_recording()
+            if vc.is_playing():
+                vc.stop()
+        except Exception:
+            log.exception("Error stopping voice client IO")
+        await self.personaplex.close()
+        log.info("Voice session stopped")
+
+    async def _send_loop(self) -> None:
+        """Feed PersonaPlex one 20ms frame per tick, silence when nobody talks.
+
+        PersonaPlex expects an uninterrupted audio stream, so idle ticks send
+        the shared SILENCE_FRAME through the converter.
+        """
+        loop = asyncio.get_running_loop()
+        # Hoisted for the 50 Hz tight loop: LOAD_FAST instead of attribute
+        # chains per tick.
+        pop = self.input_ring.pop
+        convert = self.converter.discord_to_personaplex
+        convert_silence = self.converter.encode_silence
+        send = self.personaplex.send_audio
+        now = loop.time
+        sleep = asyncio.sleep
+
+        next_tick = now()
+        while True:
+            frame = pop()
+            if frame is None:
+                # Idle tick: the converter's silence fast path skips the
+                # resampling front-end once its filter state has flushed.
+                opus_bytes = convert_silence()
+            else:
+                opus_bytes = convert(frame)
+            if opus_bytes:
+                await send(opus_bytes)
+
+            next_tick += FRAME_SECONDS
+            delay = next_tick - now()
+            if delay > 0:
+                await sleep(delay)
+            else:
+                # We fell behind (e.g. slow websocket write); resynchronize
+                # rather than bursting to catch up.
+                next_tick = now()
+
+    async def _recv_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        # Hoisted for the tight loop
+        get = self.personaplex.audio_queue.get
+        convert = self.converter.personaplex_to_discord
+        ring = self.output_ring
+        push = ring.push
+        capacity = ring.capacity
+
+        # On short bursts, stalling here for one frame time beats dropping
+        # audible frames — PersonaPlex is remote and has its own buffering.
+        # A token bucket (3 stalls, refilled at 3 per 200ms) bounds the
+        # stalling; sustained pressure falls through to the ring's
+        # drop-oldest.
+        stall_tokens = 3.0
+        last_refill = loop.time()
+        while True:
+            for frame in convert(await get()):
+                if len(ring) >= capacity:
+                    now = loop.time()
+                    stall_tokens = min(3.0, stall_tokens + (now - last_refill) * 15.0)
+                    last_refill = now
+                    if stall_tokens >= 1.0:
+                        stall_tokens -= 1.0
+                        await asyncio.sleep(FRAME_SECONDS)
+                push(frame)
+
+    async def _text_loop(self) -> None:
+        """Batch AI text tokens into readable chunks for the text channel."""
+        loop = asyncio.get_running_loop()
+        # Hoisted for the tight loop
+        get = self.personaplex.text_queue.get
+        now = loop.time
+        deadline = 0.0
+        try:
+            while True:
+                if not self._text_buffer:
+                    # Idle: wait for the first token, then open the window.
+                    text = await get()
+                    deadline = now() + TEXT_DEBOUNCE_SECONDS
+                else:
+                    remaining = deadline - now()
+                    if remaining <= 0:
+                        await self._flush_text()
+                        continue
+                    try:
+                        text = await asyncio.wait_for(get(), remaining)
+                    except asyncio.TimeoutError:
+                        await self._flush_text()
+                        continue
+
+                self._text_buffer.append(text)
+                self._text_buffer_len += len(text)
+                if self._text_buffer_len >= TEXT_FLUSH_CHARS or text.endswith(
+                    _SENTENCE_ENDS
+                ):
+                    await self._flush_text()
+        except asyncio.CancelledError:
+            await self._flush_text()
+            raise
+
+    async def _flush_text(self) -> None:
+        if not self._text_buffer:
+            return
+        joined = "".join(self._text_buffer).strip()
+        self._text_buffer.clear()
+        self._text_buffer_len = 0
+        if joined and self.text_channel is not None:
+            try:
+                await self.text_channel.send(joined)
+            except discord.HTTPException:
+                log.exception("Failed to send AI text to channel")
@@ -1,20 +1,39 @@
+import logging
 import os
+from pathlib import Path
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-DISCORD_TOKEN: str = os.environ["DISCORD_TOKEN"]
+log = logging.getLogger(__name__)
+
+try:
+    DISCORD_TOKEN: str = os.environ["DISCORD_TOKEN"]
+except KeyError:
+    raise RuntimeError(
+        "DISCORD_TOKEN is not set; copy .env.example to .env and fill it in"
+    ) from None
 
 PERSONAPLEX_URL: str = os.getenv(
     "PERSONAPLEX_URL", "wss://localhost:8998/api/chat"
 )
+if not PERSONAPLEX_URL.startswith(("ws://", "wss://")):
+    log.warning("PERSONAPLEX_URL is not a websocket URL: %s", PERSONAPLEX_URL)
 
-VOICE_PROMPT_DIR: str = os.getenv(
-    "VOICE_PROMPT_DIR",
-    "/root/.cache/huggingface/hub/models--nvidia--personaplex-7b-v1"
-    "/snapshots/3343b641d663e4c851120b3575cbdfa4cc33e7fa/voices/",
-)
+# Resolved once at import so command handlers never rebuild a Path per call.
+VOICE_PROMPT_DIR: Path = Path(
+    os.getenv(
+        "VOICE_PROMPT_DIR",
+        "/root/.cache/huggingface/hub/models--nvidia--personaplex-7b-v1"
+        "/snapshots/3343b641d663e4c851120b3575cbdfa4cc33e7fa/voices/",
+    )
+).resolve()
+if not VOICE_PROMPT_DIR.is_dir():
+    log.warning(
+        "VOICE_PROMPT_DIR does not exist: %s (!voice-list will be empty)",
+        VOICE_PROMPT_DIR,
+    )
 
 DEFAULT_VOICE: str = "NATF0.pt"
 
@@ -0,0 +1,122 @@
+"""aiohttp WebSocket client for the PersonaPlex speech-to-speech server."""
+
+import asyncio
+import logging
+from urllib.parse import urlencode
+
+import aiohttp
+
+from discordplex.config import PERSONAPLEX_URL
+from discordplex.personaplex.protocol import MessageType, decode_message
+
+log = logging.getLogger(__name__)
+
+HANDSHAKE_TIMEOUT = 60.0
+
+# Raw type bytes for the per-frame dispatch; decode_message returns plain
+# ints so the hot path never goes through IntEnum.__call__.
+_HANDSHAKE = int(MessageType.HANDSHAKE)
+_AUDIO = int(MessageType.AUDIO)
+_TEXT = int(MessageType.TEXT)
+
+
+class PersonaPlexClient:
+    """Single PersonaPlex websocket session.
+
+    Inbound messages are dispatched to ``audio_queue`` (OggOpus payloads) and
+    ``text_queue`` (decoded AI text tokens) by the receive loop.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
+        # Shared per-process session: connector/DNS/executor setup is paid
+        # once by the bot, not per voice session. Not owned by this client.
+        self._session = session
+        self.ws: aiohttp.ClientWebSocketResponse | None = None
+        self.audio_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=100)
+        self.text_queue: asyncio.Queue[str] = asyncio.Queue()
+        self._receive_task: asyncio.Task | None = None
+
+        # Per-frame dispatch: one dict lookup on the raw type byte instead
+        # of an if/elif chain of compares at ~50 Hz.
+        self._handlers = {
+            _AUDIO: self._on_audio,
+            _TEXT: self._on_text,
+        }
+
+    async def _on_audio(self, payload: bytes) -> None:
+        await self.audio_queue.put(payload)
+
+    async def _on_text(self, payload: bytes) -> None:
+        await self.text_queue.put(payload.decode("utf-8"))
+
+    async def connect(self, text_prompt: str, voice_prompt: str) -> None:
+        """Open the websocket and wait for the server's handshake byte.
+
+        The server spends several seconds processing the prompts before it
+        sends the handshake, hence the generous timeout.
+        """
+        params = urlencode({"text_prompt": text_prompt, "voice_prompt": voice_prompt})
+        url = f"{PERSONAPLEX_URL}?{params}"
+
+        # No permessage-deflate (opus is already compressed); heartbeat keeps
+        # the connection alive through silent stretches.
+        self.ws = await self._session.ws_connect(url, heartbeat=20)
+        log.info("Connected to PersonaPlex, waiting for handshake")
+        await asyncio.wait_for(self._wait_handshake(), timeout=HANDSHAKE_TIMEOUT)
+        log.info("PersonaPlex handshake complete")
+        self._receive_task = asyncio.create_task(self._receive_loop())
+
+    async def _wait_handshake(self) -> None:
+        while True:
+            msg = await self.ws.receive()
+            if msg.type == aiohttp.WSMsgType.BINARY:
+                msg_type, _ = decode_message(msg.data)
+                if msg_type == _HANDSHAKE:
+                    return
+            elif msg.type in (
+                aiohttp.WSMsgType.CLOSED,
+                aiohttp.WSMsgType.CLOSE,
+                aiohttp.WSMsgType.ERROR,
+            ):
+                raise ConnectionError("PersonaPlex closed during handshake")
+
+    async def send_audio(self, opus_bytes: bytes) -> None:
+        # encode_audio inlined: one call frame fewer at 50 Hz. Keep in sync
+        # with protocol.encode_audio.
+        await self.ws.send_bytes(b"\x01" + opus_bytes)
+
+    async def _receive_loop(self) -> None:
+        try:
+            async for msg in self.ws:
+                if msg.type != aiohttp.WSMsgType.BINARY:
+                    continue
+                # decode_message inlined (keep in sync with protocol.py).
+                # The data[1:] slice is the only copy on this path: the
+                # queue passes the same bytes object by reference and the
+                # converter hands it to sphn as-is. A memoryview would not
+                # help — sphn's append_bytes only accepts PyBytes, so a
+                # view would be re-materialized as bytes anyway.
+                data = msg.data
+                if not data:
+                    continue
+                handler = self._handlers.get(data[0])
+                if handler is not None:
+                    await handler(data[1:])
+                else:
+                    log.warning("Unexpected PersonaPlex message type: 0x%02x", data[0])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.exception("PersonaPlex receive loop failed")
+
+    async def close(self) -> None:
+        if self._receive_task is not None:
+            self._receive_task.cancel()
+            try:
+                await self._receive_task
+            except asyncio.CancelledError:
+                pass
+            self._receive_task = None
+        if self.ws is not None:
+            await self.ws.close()
+            self.ws = None
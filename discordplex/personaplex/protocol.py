@@ -0,0 +1,32 @@
+"""PersonaPlex wire protocol: a one-byte message type followed by the payload."""
+
+from enum import IntEnum
+
+
+class MessageType(IntEnum):
+    HANDSHAKE = 0x00
+    AUDIO = 0x01
+    TEXT = 0x02
+
+
+# Prebuilt prefix so the 50 Hz encode path skips both the IntEnum attribute
+# lookup and the bytes([...]) list construction.
+_AUDIO_PREFIX = b"\x01"
+
+
+def encode_audio(opus_bytes: bytes) -> bytes:
+    """Prefix OggOpus data with the audio message type byte."""
+    return _AUDIO_PREFIX + opus_bytes
+
+
+def decode_message(data: bytes) -> tuple[int, bytes]:
+    """Split a websocket message into (raw type byte, payload).
+
+    The type comes back as a plain int: IntEnum coercion costs ~10x an int
+    compare and this runs for every inbound frame. Callers compare against
+    MessageType members (IntEnum == int) or raw constants, and only coerce
+    to MessageType for logging.
+    """
+    if not data:
+        raise ValueError("Empty PersonaPlex message")
+    return data[0], data[1:] if len(data) > 1 else b""